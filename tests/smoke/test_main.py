@@ -1,6 +1,5 @@
 #!/usr/bin/env python3
 """Smoke tests."""
-import itertools
 import shutil
 from contextlib import redirect_stderr, redirect_stdout
 from io import StringIO
@@ -31,13 +30,8 @@ class TestMainShowCommands:
 
     def test_show_config_command_stretched_time(self):
         """Test again, mocking time.time so the total elapsed time is greater than 60s."""
-
-        def fake_time():
-            for new in itertools.count():
-                yield 100 * new
-
         with mock.patch(
-            "time.time", mock.MagicMock(side_effect=fake_time())
+            "time.time", mock.MagicMock(side_effect=iter(range(0, 10_000, 100)))
         ), redirect_stdout(StringIO()):
             main(["configs"])
 
@@ -60,3 +54,20 @@ def test_toml_formatter_command(tmp_path_factory):
 
     with redirect_stdout(StringIO()):
         main(["check", GeneralConstants.PACKAGE_DIRECTORY.parent.as_posix()])
+
+
+@pytest.mark.parametrize("min_n_files_for_parallel_formatting", [2, 3])
+def test_toml_formatter_command_reports_parsing_errors(
+    tmp_path_factory, monkeypatch, min_n_files_for_parallel_formatting
+):
+    toml_dir = tmp_path_factory.mktemp("toml_fmt_parsing_error_tests")
+    (toml_dir / "valid.toml").write_text('[foo]\n  bar = "baz"\n')
+    (toml_dir / "invalid.toml").write_text("x = 1__2\n")
+
+    # Have the two files formatted either by worker processes or serially
+    monkeypatch.setattr(
+        "toml_formatter.commands_functions._MIN_N_FILES_FOR_PARALLEL_FORMATTING",
+        min_n_files_for_parallel_formatting,
+    )
+    with pytest.raises(RuntimeError, match=r"invalid\.toml: InvalidNumberError"):
+        main(["check", toml_dir.as_posix()])
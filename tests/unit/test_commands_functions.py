@@ -0,0 +1,50 @@
+#!/usr/bin/env python3
+"""Tests for the functions that implement the package's commands."""
+import pytest
+
+from toml_formatter.commands_functions import _find_toml_files
+
+
+@pytest.fixture()
+def toml_tree(tmp_path):
+    root = tmp_path / "project"
+    for relpath in [
+        "a.toml",
+        ".b.toml",
+        "not_toml.txt",
+        ".hidden_dir/c.toml",
+        "subdir/d.toml",
+        "subdir/.hidden_subdir/e.toml",
+    ]:
+        fpath = root / relpath
+        fpath.parent.mkdir(parents=True, exist_ok=True)
+        fpath.write_text("")
+    return root
+
+
+def _found_files(root, **kwargs):
+    return sorted(
+        fpath.relative_to(root).as_posix() for fpath in _find_toml_files(root, **kwargs)
+    )
+
+
+def test_hidden_files_and_directories_are_skipped(toml_tree):
+    assert _found_files(toml_tree) == ["a.toml", "subdir/d.toml"]
+
+
+def test_hidden_files_and_directories_can_be_included(toml_tree):
+    assert _found_files(toml_tree, include_hidden=True) == [
+        ".b.toml",
+        ".hidden_dir/c.toml",
+        "a.toml",
+        "subdir/.hidden_subdir/e.toml",
+        "subdir/d.toml",
+    ]
+
+
+def test_root_under_hidden_directory_is_walked(tmp_path):
+    root = tmp_path / ".hidden_parent" / "project"
+    (root / ".hidden_subdir").mkdir(parents=True)
+    (root / "a.toml").write_text("")
+    (root / ".hidden_subdir" / "b.toml").write_text("")
+    assert _found_files(root) == ["a.toml"]
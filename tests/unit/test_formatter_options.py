@@ -0,0 +1,34 @@
+#!/usr/bin/env python3
+"""Tests for the formatter options."""
+import os
+
+import pytest
+from pydantic import ValidationError
+
+from toml_formatter.formatter_options import FormatterOptions
+
+
+@pytest.fixture()
+def write_config_file(tmp_path):
+    config_file = tmp_path / "pyproject.toml"
+
+    def _write_config_file(indentation):
+        config_file.write_text(f"[tool.toml-formatter]\nindentation = {indentation}\n")
+        # Make sure the modification time changes even on coarse-grained filesystems
+        stat = config_file.stat()
+        os.utime(config_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + indentation))
+        return config_file
+
+    return _write_config_file
+
+
+def test_from_toml_file_picks_up_file_changes(write_config_file):
+    for indentation in [4, 3]:
+        config_file = write_config_file(indentation)
+        assert FormatterOptions.from_toml_file(config_file).indentation == indentation
+
+
+def test_formatter_options_are_immutable(write_config_file):
+    config = FormatterOptions.from_toml_file(write_config_file(4))
+    with pytest.raises(ValidationError, match="frozen"):
+        config.indentation = 0
@@ -3,6 +3,7 @@
 import pytest
 
 from toml_formatter.formatter import FormattedToml
+from toml_formatter.formatter_options import FormatterOptions
 
 
 @pytest.fixture()
@@ -167,3 +168,38 @@ def test_toml_formatting_handles_expected_cases(
 def test_formatting_is_projection(expected_formatted_string):
     should_not_change = FormattedToml.from_string(expected_formatted_string)
     assert str(should_not_change) == expected_formatted_string
+
+
+def test_section_order_overrides_are_respected():
+    toml_string = """
+[b]
+x = 1
+[a.c]
+x = 1
+[a]
+x = 1
+[c]
+x = 1
+"""
+    formatter_options = FormatterOptions(section_order_overrides=["^c$", "^a.*"])
+    formatted_toml = FormattedToml.from_string(
+        toml_string, formatter_options=formatter_options
+    )
+    assert [section.name for section in formatted_toml.sections] == [
+        "c",
+        "a",
+        "a.c",
+        "b",
+    ]
+
+
+@pytest.mark.parametrize("ending", ["", "\n"])
+def test_table_at_end_of_file_is_kept(ending):
+    toml_string = f"[b]\n  x = 1\n\n[a]{ending}"
+    assert str(FormattedToml.from_string(toml_string)) == "[a]\n\n[b]\n  x = 1\n"
+
+
+@pytest.mark.parametrize("separator", ["\u2028", "\u2029", "\x85"])
+def test_from_string_splits_lines_only_on_newlines(separator):
+    toml_string = f"# note{separator}more\nx = 1\n"
+    assert str(FormattedToml.from_string(toml_string)) == toml_string
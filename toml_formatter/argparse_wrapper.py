@@ -2,6 +2,7 @@
 """Wrappers for argparse functionality."""
 import argparse
 import sys
+from functools import lru_cache
 from pathlib import Path
 
 from . import GeneralConstants
@@ -22,6 +23,12 @@ def get_parsed_args(program_name=GeneralConstants.PACKAGE_NAME, argv=None):
     if argv is None:
         argv = sys.argv[1:]
 
+    return _get_main_parser(program_name=program_name).parse_args(argv)
+
+
+@lru_cache(maxsize=None)
+def _get_main_parser(program_name):
+    """Build the program's command line parser. Only done once per `program_name`."""
     ######################################################################################
     # Command line args that will be common to main_parser and possibly other subparsers.#
     #                                                                                    #
@@ -109,4 +116,4 @@ def get_parsed_args(program_name=GeneralConstants.PACKAGE_NAME, argv=None):
     )
     parser_toml_formatter.set_defaults(run_command=check_toml_files_format)
 
-    return main_parser.parse_args(argv)
+    return main_parser
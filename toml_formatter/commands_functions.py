@@ -2,9 +2,10 @@
 """Implement the package's commands."""
 import difflib
 import itertools
+import os
 import sys
-
-import tomli_w
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
 
 from toml_formatter import GeneralConstants
 
@@ -20,6 +21,9 @@ def show_configs(args, config):  # noqa: ARG001
         config (.formatter_options.FormatterOptions): Parsed config file contents.
 
     """
+    # Only needed by this command. Import here to keep the CLI startup lean.
+    import tomli_w
+
     logger.info("Printing requested configs...")
     formatted_toml = FormattedToml.from_string(
         toml_string=tomli_w.dumps(config.model_dump()), formatter_options=config
@@ -27,60 +31,114 @@ def show_configs(args, config):  # noqa: ARG001
     sys.stdout.write(str(formatted_toml) + "\n")
 
 
-def check_toml_files_format(args, config):  # noqa: PLR0912
-    """Implement the `check` command."""
+def _find_toml_files(root, include_hidden=False):
+    """Recursively yield the TOML files under `root`.
 
-    def _exclude_if_hidden(fpath):
-        if args.include_hidden:
-            return False
-        return any(part.startswith(".") for part in fpath.parts)
+    Hidden directories are pruned during the walk (unless `include_hidden` is True),
+    so that trees such as `.git` or `.venv` are not descended into at all.
+    """
+    for dirpath, dirnames, filenames in os.walk(root):
+        if not include_hidden:
+            dirnames[:] = [d for d in dirnames if not d.startswith(".")]
+        for filename in filenames:
+            if filename.lower().endswith(".toml") and (
+                include_hidden or not filename.startswith(".")
+            ):
+                yield Path(dirpath) / filename
+
+
+def _format_toml_file(fpath, config):
+    """Return the path, the original and the formatted contents of a TOML file."""
+    # TOML files must be UTF-8 encoded. Read and decode them only once.
+    with open(fpath, "r", encoding="utf-8") as f:
+        actual_toml = f.read()
+    try:
+        formatted_toml = FormattedToml.from_string(actual_toml, formatter_options=config)
+    except Exception as error:  # noqa: BLE001
+        # Name the culprit file. The new error can also be sent back from worker
+        # processes, unlike tomlkit's exceptions, which cannot be unpickled.
+        raise RuntimeError(f"{fpath}: {type(error).__name__}: {error}") from error
+    return fpath, actual_toml, str(formatted_toml)
+
+
+# Formatter options used in the worker processes. Sent only once to each worker.
+_WORKER_STATE = {}
+
+
+# Below this many files, starting worker processes costs more than it saves
+_MIN_N_FILES_FOR_PARALLEL_FORMATTING = 32
+
+
+def _init_worker(config):
+    """Store the formatter options to be used by a worker process."""
+    # Log messages are only issued by the main process
+    logger.remove()
+    _WORKER_STATE["config"] = config
+
+
+def _format_toml_file_in_worker(fpath):
+    """Call `_format_toml_file` using the worker's formatter options."""
+    return _format_toml_file(fpath, _WORKER_STATE["config"])
+
+
+def _format_toml_files(fpaths, config):
+    """Format the TOML files in `fpaths`, in parallel if there are many of them."""
+    if len(fpaths) < _MIN_N_FILES_FOR_PARALLEL_FORMATTING:
+        return [_format_toml_file(fpath, config) for fpath in fpaths]
+
+    n_workers = min(len(fpaths), os.cpu_count() or 1)
+    with ProcessPoolExecutor(
+        max_workers=n_workers, initializer=_init_worker, initargs=(config,)
+    ) as executor:
+        return list(
+            executor.map(
+                _format_toml_file_in_worker,
+                fpaths,
+                chunksize=max(1, len(fpaths) // (4 * n_workers)),
+            )
+        )
 
+
+def check_toml_files_format(args, config):  # noqa: PLR0912
+    """Implement the `check` command."""
     file_iterators = []
     for path in args.file_paths:
         if path.is_dir():
             file_iterators.append(
-                fpath
-                for fpath in path.rglob("*")
-                if fpath.suffix.lower() == ".toml" and not _exclude_if_hidden(fpath)
+                _find_toml_files(path, include_hidden=args.include_hidden)
             )
         else:
             file_iterators.append([path])
 
-    n_files = 0
+    fpaths = list(itertools.chain.from_iterable(file_iterators))
+    n_files = len(fpaths)
     files_in_need_of_formatting = []
-    for fpath in itertools.chain.from_iterable(file_iterators):
-        n_files += 1
-
-        formatted_toml = FormattedToml.from_file(path=fpath, formatter_options=config)
-        actual_toml = fpath.read_text()
+    for fpath, actual_toml, formatted_toml_str in _format_toml_files(fpaths, config):
+        if actual_toml == formatted_toml_str:
+            logger.debug("File <{}> seems to be well-formatted.", fpath)
+            continue
 
-        file_needs_formatting = False
-        for diff_line in difflib.unified_diff(
+        diff = difflib.unified_diff(
             actual_toml.split("\n"),
-            str(formatted_toml).split("\n"),
+            formatted_toml_str.split("\n"),
             fromfile="Original",
             tofile="Formatted",
             lineterm="",
-        ):
-            file_needs_formatting = True
-            logger.warning(diff_line)
-
-        if file_needs_formatting:
-            if not args.fix_inplace:
-                logger.error("File <{}> needs formatting, see diff above.", fpath)
-            files_in_need_of_formatting.append(fpath)
+        )
+        logger.warning("\n".join(diff))
 
-            if args.show_formatted:
-                logger.info("The formatted version will now be printed to the stdout.")
-                sys.stdout.write(str(formatted_toml) + "\n")
+        if not args.fix_inplace:
+            logger.error("File <{}> needs formatting, see diff above.", fpath)
+        files_in_need_of_formatting.append(fpath)
 
-            if args.fix_inplace:
-                logger.debug("Fixing format of file <{}> in-place.", fpath)
-                with open(fpath, "w") as f:
-                    f.write(str(formatted_toml))
+        if args.show_formatted:
+            logger.info("The formatted version will now be printed to the stdout.")
+            sys.stdout.write(formatted_toml_str + "\n")
 
-        else:
-            logger.debug("File <{}> seems to be well-formatted.", fpath)
+        if args.fix_inplace:
+            logger.debug("Fixing format of file <{}> in-place.", fpath)
+            with open(fpath, "w", encoding="utf-8") as f:
+                f.write(formatted_toml_str)
 
     if files_in_need_of_formatting:
         if args.fix_inplace:
@@ -3,18 +3,18 @@
 import collections.abc
 import contextlib
 import csv
+import io
 import itertools
 import re
-from functools import cached_property
+from functools import cached_property, lru_cache
 from pathlib import Path
 from typing import Sequence, Tuple, Union
 
-import tomli
 import tomlkit
 from tomlkit.exceptions import UnexpectedCharError, UnexpectedEofError
 from tomlkit.items import AoT, Comment, Item, Key, Table, Whitespace
 
-from .formatter_options import DEFAULT_FORMATTER_OPTIONS, FormatterOptions
+from .formatter_options import DEFAULT_FORMATTER_OPTIONS, FormatterOptions, _toml_loads
 
 
 class _BaseTomlContentsSequence(collections.abc.Sequence):
@@ -65,7 +65,9 @@ class _ParsedTomlFileEntry:
 
     @toml_doc_obj.setter
     def toml_doc_obj(self, new):
+        self._clear_cached_str_reprs()
         self._toml_doc_obj = new
+        self._update_key_and_item()
 
         trivia = None if isinstance(self.item, Whitespace) else self.item.trivia
 
@@ -74,7 +76,11 @@ class _ParsedTomlFileEntry:
         except tomlkit.exceptions.EmptyKeyError:
             self._defined_as_key_value = False
             if isinstance(self.item, (Table, AoT)):
-                self._toml_doc_obj = tomlkit.loads(tomlkit.dumps(self.toml_doc_obj.value))
+                # Normalise the table's key. Skip re-parsing if it is already normal.
+                normalised_toml = tomlkit.dumps(self.toml_doc_obj.value)
+                if normalised_toml != self.toml_doc_obj.as_string():
+                    self._toml_doc_obj = tomlkit.loads(normalised_toml)
+                    self._update_key_and_item()
         else:
             self._defined_as_key_value = True
             self.toml_doc_obj.clear()
@@ -85,25 +91,30 @@ class _ParsedTomlFileEntry:
             elif not isinstance(value, str):
                 value = value.unwrap()
 
-            stripped_key_components = [
-                sub_k.strip()
-                for sub_k in next(
-                    csv.reader([key.as_string()], delimiter=".", skipinitialspace=True)
+            key_str = key.as_string()
+            if '"' in key_str or "'" in key_str:
+                # Quoted keys may contain dots that are not separators
+                key_components = next(
+                    csv.reader([key_str], delimiter=".", skipinitialspace=True)
                 )
-            ]
+            else:
+                key_components = key_str.split(".")
+            stripped_key_components = [sub_k.strip() for sub_k in key_components]
 
             new_key = tomlkit.key(stripped_key_components)
             self.toml_doc_obj.append(new_key, value)
+            self._update_key_and_item()
 
         if trivia is not None:
             self.item.trivia.__dict__ = trivia.__dict__
 
         self._fix_spaces_around_comments()
+        self._clear_cached_str_reprs()
 
     @property
     def key(self) -> Key:
         """Return the `Key` associated with the atomic entry."""
-        return self._tomlkit_doc_obj_body[-1][0]
+        return self._key
 
     @property
     def defined_as_key_value(self):
@@ -116,20 +127,23 @@ class _ParsedTomlFileEntry:
     @property
     def item(self) -> Item:
         """Return the `Item` associated with the atomic entry."""
-        return self._tomlkit_doc_obj_body[-1][1]
+        return self._item
 
     def indent(self, indent: int = 0):
         """Set the number of spaces for the indentation of the atomic entry."""
         self._indent_level = indent
+        self._clear_cached_str_reprs()
         _indent_atomic_toml_entry(entry=self, indent=indent)
+        # The entry's str repr may have been used, and cached, midway through the changes
+        self._clear_cached_str_reprs()
 
-    @property
-    def _tomlkit_doc_obj_body(self):
-        return [
+    def _update_key_and_item(self):
+        """Store the last non-null key and item in the doc. Call when the doc changes."""
+        self._key, self._item = [
             (k, v)
             for k, v in self.toml_doc_obj.body
             if not isinstance(v, tomlkit.items.Null)
-        ]
+        ][-1]
 
     def _fix_spaces_around_comments(self):
         if not isinstance(self.item, (Whitespace, Comment)) and self.item.trivia.comment:
@@ -137,14 +151,31 @@ class _ParsedTomlFileEntry:
             if not comment_text.startswith("#"):
                 self.item.trivia.comment = f"# {comment_text}"
                 self.item.trivia.comment_ws = " "
+                self._clear_cached_str_reprs()
+
+    def _clear_cached_str_reprs(self):
+        """Discard cached string representations. Call after modifying the entry."""
+        self._cached_repr = None
+        self._cached_as_string = None
+
+    def as_string(self) -> str:
+        """Return the TOML string of the underlying document, as rendered by tomlkit."""
+        if self._cached_as_string is None:
+            self._cached_as_string = self.toml_doc_obj.as_string()
+        return self._cached_as_string
 
     def __eq__(self, other):
         if isinstance(other, _ParsedTomlFileEntry):
-            return self.toml_doc_obj == other.toml_doc_obj
+            return self.as_string() == other.as_string()
         return False
 
     def __repr__(self):
-        str_repr = self.toml_doc_obj.as_string().rstrip()
+        if self._cached_repr is None:
+            self._cached_repr = self._get_repr()
+        return self._cached_repr
+
+    def _get_repr(self):
+        str_repr = self.as_string().rstrip()
         if isinstance(self.item, AoT) and self.defined_as_key_value:
             str_repr = _get_aot_repr(self.item, self.key)
             if len(str_repr) > self.formatter_options.line_length:
@@ -155,7 +186,28 @@ class _ParsedTomlFileEntry:
         return str_repr
 
     def __hash__(self):
-        return hash(self.toml_doc_obj.as_string())
+        return hash(self.as_string())
+
+
+@lru_cache(maxsize=256)
+def _get_blank_toml_file_entry(blank_string: str) -> _ParsedTomlFileEntry:
+    return _ParsedTomlFileEntry(blank_string)
+
+
+def _parse_toml_file_entry(single_entry_string: str) -> _ParsedTomlFileEntry:
+    """Return a parsed entry, reusing previously parsed blank lines.
+
+    Blank entries are never modified when formatting, so a single instance can be
+    shared. Other entries are modified in-place, and tomlkit objects cannot be
+    reliably copied, so these are always parsed anew.
+    """
+    if single_entry_string.isspace():
+        return _get_blank_toml_file_entry(single_entry_string)
+    return _ParsedTomlFileEntry(single_entry_string)
+
+
+# Blank line that terminates every section. Never modified, so it is shared.
+_TOML_NEWLINE = _parse_toml_file_entry("\n")
 
 
 class _TomlFileEntriesContainer(_BaseTomlContentsSequence):
@@ -173,7 +225,7 @@ class _TomlFileEntriesContainer(_BaseTomlContentsSequence):
         for line in new:
             str_to_parse = "".join([*previous_lines_failed_to_parse, line])
             try:
-                new_entry = _ParsedTomlFileEntry(str_to_parse)
+                new_entry = _parse_toml_file_entry(str_to_parse)
             except (UnexpectedEofError, UnexpectedCharError):
                 previous_lines_failed_to_parse.append(line)
             else:
@@ -203,6 +255,7 @@ class _FormattedTomlFileSection(_BaseTomlContentsSequence):
             new = _adjust_empty_lines(new)
             new = _sort_keys(new)
         self._data = tuple(new)
+        self.__dict__.pop("is_comment", None)  # Reset cached value
         if not self.is_comment:
             self._normalise_indentation()
 
@@ -214,14 +267,10 @@ class _FormattedTomlFileSection(_BaseTomlContentsSequence):
                 return str(entry).strip().strip("[]")
         return ""
 
-    @property
+    @cached_property
     def is_comment(self) -> bool:
         """Return True if the table only contains comments, and False otherwise."""
-        for entry in self:
-            if isinstance(entry.item, (Comment, Whitespace)):
-                continue
-            return False
-        return True
+        return all(isinstance(entry.item, (Comment, Whitespace)) for entry in self)
 
     def _normalise_indentation(self):
         level_number = 0
@@ -250,14 +299,18 @@ class FormattedToml:
     @classmethod
     def from_file(cls, path: Union[Path, str], **kwargs):
         """Return a class instance with info read from file located at `path`."""
-        with open(path, "r") as f:
+        with open(path, "r", encoding="utf-8") as f:
             raw_data = f.readlines()
         return cls(raw_data=raw_data, **kwargs)
 
     @classmethod
     def from_string(cls, toml_string: str, **kwargs):
         """Return a class instance with info retrieved from `toml_string`."""
-        raw_data = [f"{line}\n" for line in toml_string.split("\n")]
+        # Split on "\n" only, like reading a file does. Unlike `str.splitlines`, this
+        # leaves alone the other line separators TOML allows inside comments and strings.
+        raw_data = io.StringIO(toml_string).readlines()
+        if raw_data and not raw_data[-1].endswith("\n"):
+            raw_data[-1] += "\n"
         return cls(raw_data=raw_data, **kwargs)
 
     @property
@@ -270,9 +323,12 @@ class FormattedToml:
         for section in new:
             section.formatter_options = self.formatter_options
         self._sections = _get_sorted_sequence_of_sections(
-            new, override_sorting=self.formatter_options.section_order_overrides
+            new,
+            override_sorting=self.formatter_options.section_order_override_patterns,
         )
-        self.data = tomli.loads(str(self))
+        self.__dict__.pop("_rendered", None)  # Reset cached value
+        # Validate the result. There is no need for tomlkit's style preservation here.
+        self.data = _toml_loads(str(self))
 
     @property
     def indentation(self) -> int:
@@ -282,21 +338,34 @@ class FormattedToml:
     @indentation.setter
     def indentation(self, new):
         """Set the indentation and update the sections accordingly."""
-        self.formatter_options.indentation = new
+        self.formatter_options = FormatterOptions.model_validate(
+            {**self.formatter_options.model_dump(), "indentation": new}
+        )
         self.sections = self.sections
 
     def dumps(self):
         """Return a string representation of the formatted TOML."""
+        return self._rendered
+
+    @cached_property
+    def _rendered(self) -> str:
         return "\n".join(str(section) for section in self.sections)
 
     def __repr__(self):
         return self.dumps()
 
 
+# Indentation strings for the most common indentation levels
+_MAX_PRECOMPUTED_INDENT = 32
+_INDENT_STRINGS = tuple(i * " " for i in range(_MAX_PRECOMPUTED_INDENT + 1))
+
+
 def _indent_atomic_toml_entry(entry: _ParsedTomlFileEntry, indent: int = 0):
     if isinstance(entry.item, Whitespace):
         return
-    indent_str = indent * " "
+    indent_str = (
+        _INDENT_STRINGS[indent] if indent <= _MAX_PRECOMPUTED_INDENT else indent * " "
+    )
     if isinstance(entry.item, (Table, AoT)) and entry.defined_as_key_value:
         # For whatever reason, tomlkit treats this as a special case
         entry.key._original = indent_str + entry.key._original.strip()  # noqa: SLF001
@@ -305,17 +374,16 @@ def _indent_atomic_toml_entry(entry: _ParsedTomlFileEntry, indent: int = 0):
 
     if isinstance(entry.item, tomlkit.items.Array):
         # Convert to multiline all inline arrays whose str len is > 90 characters
-        is_multiline = any(
+        str_repr = indent_str + str(entry)
+        # Values can only be on separate lines if there is a newline somewhere
+        is_multiline = "\n" in str_repr and any(
             isinstance(value, Whitespace) and value.value.strip(" ") == "\n"
             for value in itertools.chain.from_iterable(entry.item._value)  # noqa: SLF001
         )
-        should_be_multiline = False
-        if not is_multiline:
-            str_repr = indent_str + str(entry)
-            for line in str_repr.split("\n"):
-                if len(line.rstrip()) > entry.formatter_options.line_length:
-                    should_be_multiline = True
-                    break
+        should_be_multiline = not is_multiline and (
+            max(map(len, map(str.rstrip, str_repr.split("\n"))))
+            > entry.formatter_options.line_length
+        )
 
         # There is a bug in v0.12.1 of tomlkit that will cause a "has no attribute
         # is_bolean" to be raised if we use the item's own getitem here.
@@ -339,20 +407,19 @@ def _adjust_empty_lines(
     section: Sequence[_ParsedTomlFileEntry],
 ) -> Tuple[_ParsedTomlFileEntry]:
     """Add/rm empty lines so sections start with a non-empty and end with 1 empty line."""
-    toml_newline = _ParsedTomlFileEntry("\n")
     try:
         first_non_blank = next(
             ix for ix, x in enumerate(section) if not isinstance(x.item, Whitespace)
         )
         last_non_blank = next(
             ix
-            for ix, x in reversed(list(enumerate(section)))
-            if not isinstance(x.item, Whitespace)
+            for ix in range(len(section) - 1, -1, -1)
+            if not isinstance(section[ix].item, Whitespace)
         )
     except StopIteration:
-        return (toml_newline,)
+        return (_TOML_NEWLINE,)
 
-    return (*tuple(section[first_non_blank : last_non_blank + 1]), toml_newline)
+    return (*tuple(section[first_non_blank : last_non_blank + 1]), _TOML_NEWLINE)
 
 
 def _remove_consecutive_blanks(
@@ -397,45 +464,34 @@ def _split_data_in_sections(
     entries: _TomlFileEntriesContainer,
     formatter_options: FormatterOptions = DEFAULT_FORMATTER_OPTIONS,
 ) -> Tuple[_FormattedTomlFileSection]:
-    sections = []
-    new_section = []
-    new_section_start = True
-    for entry in entries:
-        new_section_start = (
-            isinstance(entry.item, (Table, AoT)) and not entry.defined_as_key_value
-        )
-        if new_section_start:
-            # Find comments that should be attached to next section
-            backwards_enumerate = reversed(list(enumerate(new_section)))
-            i_last_valid = next(
-                (ix for ix, x in backwards_enumerate if not isinstance(x.item, Comment)),
-                -1,
-            )
-            comments_that_belong_to_next_section = new_section[i_last_valid + 1 :]
-            new_section = new_section[: i_last_valid + 1]
+    entries = tuple(entries)
 
-            if new_section:
-                sections.append(new_section)
-            new_section = [*comments_that_belong_to_next_section, entry]
-        else:
-            new_section.append(entry)
-    if not new_section_start:
-        sections.append(new_section)
+    # Find where sections start. Comments right before a table belong to its section.
+    section_starts = [0]
+    for ientry, entry in enumerate(entries):
+        if isinstance(entry.item, (Table, AoT)) and not entry.defined_as_key_value:
+            i_start = ientry
+            while i_start > section_starts[-1] and isinstance(
+                entries[i_start - 1].item, Comment
+            ):
+                i_start -= 1
+            section_starts.append(i_start)
+    section_ends = [*section_starts[1:], len(entries)]
 
     rtn = []
-    for section in sections:
+    for i_start, i_end in zip(section_starts, section_ends):
         # Find eventual orphan comments and separate them from section
         i_last_valid = next(
             (
                 ix
-                for ix, x in reversed(list(enumerate(section)))
-                if not isinstance(x.item, (Comment, Whitespace))
+                for ix in range(i_end - 1, i_start - 1, -1)
+                if not isinstance(entries[ix].item, (Comment, Whitespace))
             ),
-            -1,
+            i_start - 1,
         )
 
-        actual_section = section[: i_last_valid + 1]
-        dangling_comments = section[i_last_valid + 1 :]
+        actual_section = entries[i_start : i_last_valid + 1]
+        dangling_comments = entries[i_last_valid + 1 : i_end]
         for sec in [actual_section, dangling_comments]:
             if all(isinstance(entry.item, Whitespace) for entry in sec):
                 continue
@@ -447,31 +503,37 @@ def _split_data_in_sections(
 
 
 def _get_sorted_sequence_of_sections(
-    sections: Sequence[_FormattedTomlFileSection], override_sorting: Sequence[str] = ()
+    sections: Sequence[_FormattedTomlFileSection],
+    override_sorting: Sequence[re.Pattern] = (),
 ) -> Tuple[_FormattedTomlFileSection]:
     sorting_blocks = []
     current_block = []
 
     # Put the overriden sections at the front manually
+    section_names = [s.name for s in sections]
     manual_order_section_names = [""]
-    for manual_order_section_name in override_sorting:
-        regex = re.compile(manual_order_section_name)
+    for regex in override_sorting:
+        already_matched_names = set(manual_order_section_names)
         section_names_for_match = [
-            s.name for s in sections if s.name not in manual_order_section_names
+            name for name in section_names if name not in already_matched_names
         ]
         matched_section_names = sorted(filter(regex.match, section_names_for_match))
         manual_order_section_names += matched_section_names
 
-    manual_order_sections = []
-    for section_name in manual_order_section_names:
-        for section in sections:
-            if section.is_comment:
-                continue
-            if section.name == section_name:
-                manual_order_sections.append(section)
-                break
-
-    sections_to_enter_sorting = [s for s in sections if s not in manual_order_sections]
+    first_section_with_name = {}
+    for section in sections:
+        if not section.is_comment:
+            first_section_with_name.setdefault(section.name, section)
+    manual_order_sections = [
+        first_section_with_name[section_name]
+        for section_name in manual_order_section_names
+        if section_name in first_section_with_name
+    ]
+
+    manual_order_section_ids = {id(section) for section in manual_order_sections}
+    sections_to_enter_sorting = [
+        s for s in sections if id(s) not in manual_order_section_ids
+    ]
     for section in sections_to_enter_sorting:
         if section.is_comment:
             # This is a dangling comment section, marking the split between blocks
@@ -508,10 +570,7 @@ def _get_aot_repr(aot: AoT, key: tomlkit.items.Key, multiline: bool = False):
     str_repr = toml_doc_obj.as_string()
     if multiline:
         # Fix indentation of AoT items
-        import io
-
-        buf = io.StringIO(str_repr)
-        lines = buf.read().splitlines()
+        lines = str_repr.splitlines()
         for iline in range(1, len(lines) - 1):
             lines[iline] = 2 * aot.trivia.indent + lines[iline].strip()
         str_repr = "\n".join(lines)
@@ -1,30 +1,69 @@
 #!/usr/bin/env python3
 """Registration and validation of options passed to the formatter."""
-from functools import reduce
+import contextlib
+import os
+import re
+from functools import cached_property
 from pathlib import Path
 from typing import Literal, Union
 
-import tomli
-from pydantic import BaseModel, NonNegativeInt, PositiveInt
+from pydantic import BaseModel, ConfigDict, NonNegativeInt, PositiveInt
+
+try:
+    import tomllib as _tomllib
+except ImportError:  # Python < 3.11
+    import tomli as _tomllib
+
+
+def _toml_load(toml_file):
+    """Parse the contents of the binary file object `toml_file` as TOML."""
+    return _tomllib.load(toml_file)
+
+
+def _toml_loads(toml_string):
+    """Parse `toml_string` as TOML."""
+    return _tomllib.loads(toml_string)
+
+
+# Parsed config files, keyed by (path, modification time, size)
+_CACHE = {}
 
 
 class FormatterOptions(BaseModel):
     """Model for the formatter's configuration options."""
 
+    model_config = ConfigDict(frozen=True)
+
     line_length: PositiveInt = 90
     indentation: NonNegativeInt = 2
     section_order_overrides: tuple[str, ...] = ()
     loglevel: Literal["INFO", "DEBUG", "WARNING", "ERROR", "CRITICAL"] = "INFO"
 
+    @cached_property
+    def section_order_override_patterns(self) -> tuple[re.Pattern, ...]:
+        """Return the compiled regexes listed in `section_order_overrides`."""
+        return tuple(re.compile(pattern) for pattern in self.section_order_overrides)
+
     @classmethod
     def from_toml_file(cls, path: Union[str, Path]):
-        """Parse a config file and return an instance of the class."""
+        """Parse a config file and return an instance of the class.
+
+        Results are cached for as long as the file's modification time and size remain
+        unchanged. Instances are immutable, so the cached ones are returned directly.
+        """
+        path = os.path.realpath(path)
+        path_stat = os.stat(path)
+        cache_key = (cls, path, path_stat.st_mtime_ns, path_stat.st_size)
+        with contextlib.suppress(KeyError):
+            return _CACHE[cache_key]
+
         with open(path, "rb") as config_file:
             try:
-                configs = tomli.load(config_file)["tool"]["toml-formatter"]
+                configs = _toml_load(config_file)["tool"]["toml-formatter"]
             except KeyError:
                 configs = {}
-        return cls(**configs)
+        _CACHE[cache_key] = cls.model_validate(configs)
+        return _CACHE[cache_key]
 
     def __getitem__(self, item):
         """Get items from container.
@@ -42,14 +81,14 @@ class FormatterOptions(BaseModel):
         Returns:
             Any: Value of the item.
         """
+        # Option names are Python identifiers, so dotted items are always nested ones
+        value = self
         try:
-            # Try regular getitem first in case "A.B. ... C" is actually a single key
-            return getattr(self, item)
-        except AttributeError:
-            try:
-                return reduce(getattr, item.split("."), self)
-            except AttributeError as error:
-                raise KeyError(item) from error
+            for sub_item in item.split("."):
+                value = getattr(value, sub_item)
+        except AttributeError as error:
+            raise KeyError(item) from error
+        return value
 
 
 DEFAULT_FORMATTER_OPTIONS = FormatterOptions()
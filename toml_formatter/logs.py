@@ -53,6 +53,9 @@ class LogFormatter:
         return rtn
 
 
+_DEFAULT_LOG_FORMATTER = LogFormatter()
+
+
 class LoggerHandlers(Sequence):
     """Helper class to configure logger handlers when using `loguru.logger.configure`."""
 
@@ -60,6 +63,7 @@ class LoggerHandlers(Sequence):
         """Initialise instance with default loglevel and sinks."""
         self.default_level = default_level.upper()
         self.handlers = {}
+        self._handler_configs = ()
         for name, sink in {**LogDefaults.SINKS, **sinks}.items():
             self.add(name=name, sink=sink)
 
@@ -67,7 +71,7 @@ class LoggerHandlers(Sequence):
         """Add handler to instance."""
         configs["level"] = configs.pop("level", self.default_level).upper()
         configs["format"] = configs.pop(
-            "format", LogFormatter().format_string(configs["level"])
+            "format", _DEFAULT_LOG_FORMATTER.format_string(configs["level"])
         )
 
         try:
@@ -77,16 +81,17 @@ class LoggerHandlers(Sequence):
             configs["sink"] = sink
 
         self.handlers[name] = configs
+        self._handler_configs = tuple(self.handlers.values())
 
     def __repr__(self):
         return pprint.pformat(self.handlers)
 
     # Implement abstract methods
     def __getitem__(self, item):
-        return tuple(self.handlers.values())[item]
+        return self._handler_configs[item]
 
     def __len__(self):
-        return len(self.handlers)
+        return len(self._handler_configs)
 
 
 def log_elapsed_time(**kwargs):